@@ -1 +1,5 @@
 """Code for producing the results of the assignment_4 project."""
+
+from assignment_4.config import _configure_pandas
+
+_configure_pandas()
@@ -1,6 +1,8 @@
 """All the general configuration of the project."""
 from pathlib import Path
 
+import pandas as pd
+
 SRC = Path(__file__).parent.resolve()
 BLD = SRC.joinpath("..", "..", "bld").resolve()
 
@@ -14,4 +16,11 @@ SCORE_NAMES = {
     "peer": "bpiE",
 }
 
+def _configure_pandas():
+    """Set the project-wide pandas options exactly once."""
+    pd.options.mode.copy_on_write = True
+    pd.options.future.infer_string = True
+    pd.options.plotting.backend = "plotly"
+
+
 __all__ = ["BLD", "SRC", "SCORE_NAMES", "TEST_DIR"]
@@ -1,10 +1,7 @@
 """Functions for cleaning the datasets."""
+import numpy as np
 import pandas as pd
 
-pd.options.mode.copy_on_write = True
-pd.options.future.infer_string = True
-pd.options.plotting.backend = "plotly"
-
 
 def clean_chs_data(raw):
     """Clean 'raw' DataFrame, create a new DataFrame with the same index as 'raw' and
@@ -19,82 +16,65 @@ def clean_chs_data(raw):
         df (pd.DataFrame): The cleaned data.
 
     """
-    df = pd.DataFrame(index=raw.index)
-    df["momid"] = (raw["momid"]).astype(pd.UInt32Dtype())
-    df["age"] = (raw["age"]).astype(pd.UInt32Dtype())
-    for i in ["bpiA", "bpiB", "bpiC", "bpiD", "bpiE"]:
-        df[i] = _clean_bpi(raw[i]).astype(pd.Float32Dtype())
+    ids = raw[["momid", "age", "childid", "year"]]
+    mask = ids.isna().to_numpy()
+    vals = np.nan_to_num(ids.to_numpy(), nan=0).astype(np.uint32)
+
+    bpi_cols = ["bpiA", "bpiB", "bpiC", "bpiD", "bpiE"]
+    bpi = raw[bpi_cols].to_numpy(dtype=np.float32, copy=True)
+    bpi[bpi == -100.0] = np.nan
+
+    df = pd.DataFrame(
+        {
+            "momid": pd.arrays.IntegerArray(vals[:, 0].copy(), mask[:, 0].copy()),
+            "age": pd.arrays.IntegerArray(vals[:, 1].copy(), mask[:, 1].copy()),
+            **{
+                col: pd.array(bpi[:, i], dtype=pd.Float32Dtype())
+                for i, col in enumerate(bpi_cols)
+            },
+        },
+        index=raw.index,
+        copy=False,
+    )
     return df.set_index(
         [
-            (raw["childid"]).astype(pd.UInt32Dtype()),
-            (raw["year"]).astype(pd.UInt32Dtype()),
+            pd.Index(
+                pd.arrays.IntegerArray(vals[:, 2].copy(), mask[:, 2].copy()),
+                name="childid",
+            ),
+            pd.Index(
+                pd.arrays.IntegerArray(vals[:, 3].copy(), mask[:, 3].copy()),
+                name="year",
+            ),
         ],
     )
 
 
-def _clean_bpi(sr):
-    """Replace BPI values '-100' with pd.NA."""
-    return sr.replace({-100.000000: pd.NA})
-
-
 ##-----------------------------------------------------------------##
 
 
 def clean_and_reshape_nlsy_data(raw, info):
-    cleaned_yearly_data = [clean_year_data(raw, i, info) for i in range(1986, 2011, 2)]
-    return pd.concat(cleaned_yearly_data)
-
-
-def clean_year_data(raw, year, info):
-    mapping_dict = {"not true": 0, "sometimes true": 1, "often true": 1}
-
-    df = pd.DataFrame(index=raw.index)
-    for i in raw.columns[:3]:
-        df[i] = raw[i]
-    year_list = _filter_by_year(raw, year, info)
-    df[year_list] = raw[year_list]
-    df["year"] = year
-    df = _clean_bpi_variables(df, info)
-    df["childid"] = df["childid"].astype(pd.UInt32Dtype())
-    df["momid"] = df["momid"].astype(pd.UInt32Dtype())
-    df["birth_order"] = df["birth_order"].cat.codes
-    df = df.set_index(["childid", "year"])
-    for i in df.columns[2:]:
-        df[i] = _clean_bpi_cat(df[i])
-
-    df = pd.concat([df, _add_subscale_scores(df, mapping_dict)], axis=1)
-    return df.sort_index()
-
-
-def _filter_by_year(raw_df, year, info):
-    info_by_year = info.loc[info.survey_year == str(year)]
-    return info_by_year.loc[:, "nlsy_name"].to_list()
-
-
-def _clean_bpi_variables(df, info_df):
-    clean_variables = dict(
-        zip(info_df.nlsy_name, info_df.readable_name),
-    )  # creating a dictionary to rename columns in raw data
-    return df.rename(columns=clean_variables)
-
-
-def _clean_bpi_cat(sr):
-    sr = sr.replace([-7.0, -3.0, -2.0, -1.0], pd.NA)
-    sr = sr.replace({"Never Attended School": pd.NA, "Multiple selection": pd.NA})
-    categories = ["not true", "sometimes true", "often true"]
-    return (
-        sr.astype(pd.StringDtype())
-        .str.lower()
-        .astype(pd.CategoricalDtype(categories=categories, ordered=True))
-    )
+    """Reshape 'raw' NLSY data to long format and compute the subscale scores.
+
+    Instead of building a separate DataFrame per survey year, melt all
+    year-specific BPI columns at once, map the answers to {0, 1} and average
+    them per (childid, year, subscale) in a single groupby.
 
+    Args:
+        raw (pd.DataFrame): Raw NLSY data with one column per BPI variable.
+        info (pd.DataFrame): Variable metadata mapping each 'nlsy_name' to its
+        'readable_name' and 'survey_year'.
 
-def _add_subscale_scores(df, dict):
-    subscale = df.copy()
-    for i in subscale.columns[2:]:
-        subscale[i] = subscale[i].map(dict)
+    Returns:
+        df (pd.DataFrame): The subscale scores together with 'momid' and
+        'birth_order', indexed by 'childid' and 'year'.
 
-    categories = [
+    """
+    # Stata answer codes: 1 = often true, 2 = sometimes true, 3 = not true.
+    # Any other code (missing sentinels, never attended school, multiple
+    # selections) counts as missing.
+    mapping_dict = {1.0: 1, 2.0: 1, 3.0: 0}
+    subscales = [
         "antisocial",
         "anxiety",
         "headstrong",
@@ -102,8 +82,50 @@ def _add_subscale_scores(df, dict):
         "dependence",
         "peer",
     ]
-    for i in categories:
-        subscale[i] = subscale[
-            [col for col in subscale.columns if col.startswith(i)]
-        ].mean(axis=1)
-    return subscale[categories]
+
+    invariant = info.loc[info.survey_year == "invariant"]
+    items = info.loc[info.survey_year != "invariant"]
+    raw = raw.rename(columns=dict(zip(invariant.nlsy_name, invariant.readable_name)))
+
+    long = raw.melt(
+        id_vars=["childid"],
+        value_vars=items.nlsy_name.to_list(),
+        var_name="nlsy_name",
+    )
+    long = long.merge(
+        items[["nlsy_name", "readable_name", "survey_year"]],
+        on="nlsy_name",
+    )
+    long["subscale"] = long["readable_name"].str.extract(r"^([a-z]+)", expand=False)
+    # Factorize once and gather through a small lookup array instead of an
+    # elementwise .map over the full melted column.
+    codes, labels = long["value"].factorize()
+    lookup = np.array(
+        [*(mapping_dict.get(label, np.nan) for label in labels), np.nan],
+        dtype="float32",
+    )
+    long["value"] = lookup[codes]
+
+    scores = (
+        long.groupby(
+            [
+                long["childid"].astype(pd.UInt32Dtype()),
+                long["survey_year"].astype("uint32").rename("year"),
+                "subscale",
+            ],
+            observed=True,
+        )["value"]
+        .mean()
+        .unstack("subscale")
+        .reindex(columns=subscales)
+    )
+
+    ids = pd.DataFrame(
+        {
+            "childid": raw["childid"].astype(pd.UInt32Dtype()),
+            "momid": raw["momid"].astype(pd.UInt32Dtype()),
+            "birth_order": raw["birth_order"].astype("int8"),
+        },
+    ).set_index("childid")
+    scores = scores.join(ids, on="childid")
+    return scores[["momid", "birth_order", *subscales]]
@@ -14,10 +14,10 @@ merge_data_deps = {
 
 def task_merge_chs_nlsy_data(
     depends_on=merge_data_deps,
-    produces=BLD / "python" / "data" / "merged_chs_nlsy_data.csv",
+    produces=BLD / "python" / "data" / "merged_chs_nlsy_data.arrow",
 ):
     "Merge the data."
     clean_chs_data = pd.read_feather(depends_on["clean_chs_data"])
     clean_nlsy_data = pd.read_feather(depends_on["clean_nlsy_data"])
     merged_data = merge_df(clean_chs_data, clean_nlsy_data)
-    merged_data.to_csv(produces)
+    merged_data.reset_index().to_feather(produces, compression="zstd")
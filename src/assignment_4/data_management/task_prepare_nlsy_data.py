@@ -18,7 +18,14 @@ def task_prepare_nlsy_data(
     depends_on=prepare_nlsy_deps,
     produces=BLD / "python" / "data" / "clean_nlsy_data.arrow",
 ):
-    raw = pd.read_stata(depends_on["data"])
     info = pd.read_csv(depends_on["data_info"])
+    # Only load the variables the cleaning step actually uses, and keep the
+    # raw Stata answer codes instead of building value-label categoricals
+    # that the cleaning would immediately map away again.
+    raw = pd.read_stata(
+        depends_on["data"],
+        columns=info.nlsy_name.unique().tolist(),
+        convert_categoricals=False,
+    )
     cleaned_data = clean_and_reshape_nlsy_data(raw=raw, info=info)
     cleaned_data.to_feather(produces)
@@ -1,13 +1,8 @@
 """Functions plotting results."""
 
-import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 
-pd.options.mode.copy_on_write = True
-pd.options.future.infer_string = True
-pd.options.plotting.backend = "plotly"
-
 
 def create_plots(df, x, y):
     """Creates a scatter plot with a trendline for each age group.
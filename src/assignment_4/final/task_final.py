@@ -5,16 +5,12 @@ from pathlib import Path
 import pandas as pd
 import pytask
 
-pd.options.mode.copy_on_write = True
-pd.options.future.infer_string = False
-pd.options.plotting.backend = "plotly"
-
 from assignment_4.config import BLD, SCORE_NAMES
 from assignment_4.final.plot import create_plots, plot_monte_carlo
 
 dep = {
     "scripts": Path("plot.py"),
-    "data": BLD / "python" / "data" / "merged_chs_nlsy_data.csv",
+    "data": BLD / "python" / "data" / "merged_chs_nlsy_data.arrow",
 }
 
 for seed, id_ in SCORE_NAMES.items():
@@ -29,7 +25,8 @@ for seed, id_ in SCORE_NAMES.items():
         """Create plots of the score for every attribute calculated against the scores
         in the chs dataset by age group and write them in html files.
         """
-        merged_data = pd.read_csv(depends_on["data"])
+        # Each plot only needs its two score columns and the age facet
+        merged_data = pd.read_feather(depends_on["data"], columns=[seed, id_, "age"])
         fig = create_plots(merged_data, x=seed, y=id_)
         fig.write_image(produces, width=1080, height=720)
 
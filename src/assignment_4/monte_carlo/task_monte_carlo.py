@@ -1,15 +1,10 @@
 from pathlib import Path
 
 import numpy as np
-import pandas as pd
 
 from assignment_4.config import BLD
 from assignment_4.monte_carlo.model import do_monte_carlo
 
-pd.options.mode.copy_on_write = True
-pd.options.future.infer_string = True
-pd.options.plotting.backend = "plotly"
-
 
 def task_run_monte_carlo_simulation(
     produces: Path = BLD / "python" / "models" / "monte_carlo_results.pkl",
@@ -1,5 +1,4 @@
 import numpy as np
-import pandas as pd
 import pytest
 from assignment_4.monte_carlo.model import (
     _generate_cov_matrix,
@@ -9,10 +8,6 @@ from assignment_4.monte_carlo.model import (
 )
 from scipy import stats
 
-pd.options.mode.copy_on_write = True
-pd.options.future.infer_string = True
-pd.options.plotting.backend = "plotly"
-
 
 @pytest.fixture()
 def inputs():
@@ -67,9 +62,10 @@ def test_generate_independent_and_dependent_variables_correct_shape(inputs):
     )
     n_params = len(true_params)
     cov = _generate_cov_matrix(cov_type, n_params, rng)
+    chol = np.linalg.cholesky(cov)
     X, y, epsilon = _generate_independent_and_dependent_variables(
         mean,
-        cov,
+        chol,
         n_obs,
         y_sd,
         rng,